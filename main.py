@@ -1,40 +1,234 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from datetime import datetime
+import csv
+import math
+import numbers
 import os
+import re
 import warnings
 warnings.filterwarnings('ignore')
 
+INVENTORY_COLUMNS = ['Title', 'Author', 'Genre', 'Price', 'Quantity']
+SALES_COLUMNS = ['Date', 'Title', 'Quantity Sold', 'Total Revenue']
+CATEGORICAL_COLUMNS = ['Title', 'Author', 'Genre']
+INVENTORY_DTYPES = {'Price': 'float64', 'Quantity': 'int64'}
+SALES_DTYPES = {'Quantity Sold': 'int64', 'Total Revenue': 'float64'}
+MAX_QUANTITY = np.iinfo(np.int64).max
+_CACHE_KEY_FIELD = b'bookstore_cache_key'
+
+_NUM_RE = re.compile(r'^-?(\d+(\.\d*)?|\.\d+)$')
+_INT_RE = re.compile(r'^-?\d+$')
+
+
+def _parse_number(value, pattern, convert):
+    # Text is screened by the pattern so bad input never raises; numbers from
+    # the programmatic API convert directly, with NaN, inf and overflow
+    # reported as invalid (None) rather than raised
+    if isinstance(value, str):
+        if pattern.match(value.strip()) is None:
+            return None
+    elif not isinstance(value, numbers.Real):
+        return None
+    try:
+        result = convert(value)
+    except (ValueError, OverflowError):
+        return None
+    if isinstance(result, float) and not math.isfinite(result):
+        return None
+    # int() truncates, so a fractional number is not a valid quantity
+    if not isinstance(value, str) and result != value:
+        return None
+    return result
+
+
+def _is_feather(path):
+    return os.path.splitext(path)[1].lower() == '.feather'
+
+
+def _read_table(path, dtype, **csv_kwargs):
+    if _is_feather(path):
+        return pd.read_feather(path).astype(dtype)
+
+    # Reuse the parsed frame from the last session while the CSV and the
+    # dtypes it is parsed with are unchanged; a cache built under another
+    # schema may have lost precision, so it is re-parsed rather than cast.
+    # Feather (not pickle) so a planted cache file cannot run code on load.
+    stat = os.stat(path)
+    cache_key = f"{stat.st_mtime_ns}:{stat.st_size}:{sorted(dtype.items())!r}".encode()
+    cache_path = path + '.cache.feather'
+    try:
+        from pyarrow import feather
+        table = feather.read_table(cache_path)
+        if (table.schema.metadata or {}).get(_CACHE_KEY_FIELD) == cache_key:
+            return table.to_pandas()
+    except Exception:
+        # Any unreadable cache (missing, corrupt, pyarrow not installed)
+        # just means re-parsing the CSV
+        pass
+
+    df = pd.read_csv(path, dtype=dtype, **csv_kwargs)
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, _CACHE_KEY_FIELD: cache_key})
+        feather.write_feather(table, cache_path)
+    except Exception:
+        pass
+    return df
+
+
+def _write_table(df, path):
+    if _is_feather(path):
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _write_rows_csv(path, rows, header_cols):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(header_cols)
+        writer.writerows(rows)
+
+
+def _append_rows_csv(path, rows, header_cols):
+    write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, 'a', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        if write_header:
+            writer.writerow(header_cols)
+        writer.writerows(rows)
+
+
+def _add_categories(df, values):
+    for col, value in values.items():
+        if value not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories([value])
+
+
+def _append_row(df, key, row):
+    # .loc enlargement falls back to object/str columns, so build the new
+    # row with the frame's own dtypes to keep the categoricals intact.
+    # pandas has no in-place row append: this copies the frame, so in-memory
+    # inserts stay O(N) and only the file write is O(1). Use
+    # batch_record_sales to pay that copy once per batch of sales.
+    new_row = pd.DataFrame([row], columns=df.columns, index=pd.Index([key], name=df.index.name))
+    return pd.concat([df, new_row.astype(df.dtypes.to_dict())])
+
+
+def _update_moments(moments, values):
+    # Chan et al. merge of (count, mean, M2) so in-memory and chunked stats
+    # share one numerically stable single-pass accumulator
+    count, mean, m2 = moments
+    n = len(values)
+    if n == 0:
+        return moments
+    chunk_mean = values.sum(dtype=np.float64) / n
+    chunk_m2 = np.square(values - chunk_mean).sum()
+    total = count + n
+    delta = chunk_mean - mean
+    return total, mean + delta * n / total, m2 + chunk_m2 + delta ** 2 * count * n / total
+
+
+def _index_by_title(df):
+    df.index = pd.Index(df['Title'].str.lower(), name='_title_lc')
+    return df
+
+
 class Bookstore:
     
     def __init__(self, inventory_file='inventory.csv', sales_file='sales.csv'):
         self.inventory_file = inventory_file
         self.sales_file = sales_file
         self.inventory_df = self.load_inventory()
-        self.sales_df = self.load_sales()
+        self._saved_inventory_rows = len(self.inventory_df)
+        self._sales_df = None
+        self._invalidate_analytics()
+
+    # The sales log is only read on first use, so chunked analysis of a large
+    # log never has to hold the whole file in memory
+    @property
+    def sales_df(self):
+
+        if self._sales_df is None:
+            self._sales_df = self.load_sales()
+            self._saved_sales_rows = len(self._sales_df)
+        return self._sales_df
+
+    @sales_df.setter
+    def sales_df(self, df):
+
+        self._sales_df = df
         
     def load_inventory(self):
         try:
-            df = pd.read_csv(self.inventory_file)
-            return df
+            df = _read_table(self.inventory_file, INVENTORY_DTYPES)
         except FileNotFoundError:
             print(f"Inventory file {self.inventory_file} not found. Creating new inventory.")
-            df = pd.DataFrame(columns=['Title', 'Author', 'Genre', 'Price', 'Quantity'])
-            return df
+            df = pd.DataFrame(columns=INVENTORY_COLUMNS).astype(INVENTORY_DTYPES)
+
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype('category')
+        df = _index_by_title(df)
+
+        # Title lookups need a unique key, so keep only the first of any titles
+        # that differ just by case
+        duplicated = df.index.duplicated()
+        if duplicated.any():
+            for title in df.loc[duplicated, 'Title']:
+                print(f"Duplicate title '{title}' in {self.inventory_file} ignored; keeping the first entry.")
+            df = df[~duplicated]
+        return df
     
     def load_sales(self):
         try:
-            df = pd.read_csv(self.sales_file)
-            df['Date'] = pd.to_datetime(df['Date'])
-            return df
+            df = _read_table(self.sales_file, SALES_DTYPES, parse_dates=['Date'])
         except FileNotFoundError:
             print(f"Sales file {self.sales_file} not found. Creating new sales log.")
-            df = pd.DataFrame(columns=['Date', 'Title', 'Quantity Sold', 'Total Revenue'])
-            df['Date'] = pd.to_datetime(df['Date'])
-            return df
+            df = pd.DataFrame(columns=SALES_COLUMNS).astype({'Date': 'datetime64[ns]', **SALES_DTYPES})
+
+        # Share the inventory's title categories, keeping titles of books since removed
+        title_categories = self.inventory_df['Title'].cat.categories.union(df['Title'].dropna().unique())
+        df['Title'] = pd.Categorical(df['Title'], categories=title_categories)
+        return df
     
+    def _invalidate_analytics(self):
+
+        self._sales_enriched_cache = None
+        self._monthly_sales_cache = None
+
+    @property
+    def _sales_enriched(self):
+
+        if self._sales_enriched_cache is None:
+            self._sales_enriched_cache = self.sales_df.merge(
+                self.inventory_df[['Title', 'Author', 'Genre', 'Price']],
+                on='Title',
+                how='left'
+            )
+        return self._sales_enriched_cache
+
+    @property
+    def _monthly_sales(self):
+
+        if self._monthly_sales_cache is None:
+            self._monthly_sales_cache = self.sales_df.groupby(self.sales_df['Date'].dt.strftime('%Y-%m')).agg({
+                'Quantity Sold': 'sum',
+                'Total Revenue': 'sum'
+            })
+        return self._monthly_sales_cache
+
+    def _find_book(self, title):
+
+        book_key = title.lower()
+        try:
+            self.inventory_df.index.get_loc(book_key)
+        except KeyError:
+            return None
+        return book_key
+
     def validate_book_data(self, title, author, genre, price, quantity):
         errors = []
       
@@ -47,19 +241,23 @@ class Bookstore:
         if not genre or genre.strip() == "":
             errors.append("Genre cannot be empty")
 
-        try:
-            price = float(price)
+        parsed_price = _parse_number(price, _NUM_RE, float)
+        if parsed_price is not None:
+            price = parsed_price
             if price <= 0:
                 errors.append("Price must be positive")
-        except (ValueError, TypeError):
+        else:
             errors.append("Price must be a valid number")
         
 
-        try:
-            quantity = int(quantity)
+        parsed_quantity = _parse_number(quantity, _INT_RE, int)
+        if parsed_quantity is not None:
+            quantity = parsed_quantity
             if quantity < 0:
                 errors.append("Quantity cannot be negative")
-        except (ValueError, TypeError):
+            elif quantity > MAX_QUANTITY:
+                errors.append(f"Quantity cannot exceed {MAX_QUANTITY}")
+        else:
             errors.append("Quantity must be a valid integer")
         
         return errors, price, quantity
@@ -76,23 +274,19 @@ class Bookstore:
                 print(f"- {error}")
             return False
  
-        existing_book = self.inventory_df[self.inventory_df['Title'].str.lower() == title.lower()]
-        
-        if not existing_book.empty:
+        if self._find_book(title) is not None:
             print(f"Book '{title}' already exists. Use update_inventory to modify quantity.")
             return False
         
 
-        new_book = pd.DataFrame({
-            'Title': [title],
-            'Author': [author],
-            'Genre': [genre],
-            'Price': [validated_price],
-            'Quantity': [validated_quantity]
-        })
-        
-        self.inventory_df = pd.concat([self.inventory_df, new_book], ignore_index=True)
-        self.save_inventory()
+        _add_categories(self.inventory_df, {'Title': title, 'Author': author, 'Genre': genre})
+        self.inventory_df = _append_row(
+            self.inventory_df,
+            title.lower(),
+            [title, author, genre, validated_price, validated_quantity]
+        )
+        self.save_inventory(mode='append')
+        self._invalidate_analytics()
         print(f"Book '{title}' added successfully!")
         return True
     
@@ -103,17 +297,20 @@ class Bookstore:
             if quantity < 0:
                 print("Quantity cannot be negative")
                 return False
+            if quantity > MAX_QUANTITY:
+                print(f"Quantity cannot exceed {MAX_QUANTITY}")
+                return False
         except (ValueError, TypeError):
             print("Quantity must be a valid integer")
             return False
 
-        book_index = self.inventory_df[self.inventory_df['Title'].str.lower() == title.lower()].index
+        book_key = self._find_book(title)
         
-        if book_index.empty:
+        if book_key is None:
             print(f"Book '{title}' not found in inventory")
             return False
 
-        self.inventory_df.loc[book_index[0], 'Quantity'] = quantity
+        self.inventory_df.at[book_key, 'Quantity'] = quantity
         self.save_inventory()
         print(f"Inventory updated for '{title}'. New quantity: {quantity}")
         return True
@@ -129,62 +326,159 @@ class Bookstore:
             print("Quantity must be a valid integer")
             return False
 
-        book_index = self.inventory_df[self.inventory_df['Title'].str.lower() == title.lower()].index
+        book_key = self._find_book(title)
         
-        if book_index.empty:
+        if book_key is None:
             print(f"Book '{title}' not found in inventory")
             return False
 
-        available_quantity = self.inventory_df.loc[book_index[0], 'Quantity']
+        available_quantity = self.inventory_df.at[book_key, 'Quantity']
         if available_quantity < quantity:
             print(f"Insufficient stock. Available: {available_quantity}, Requested: {quantity}")
             return False
         
 
-        book_price = self.inventory_df.loc[book_index[0], 'Price']
+        book_price = self.inventory_df.at[book_key, 'Price']
         total_revenue = book_price * quantity
         
 
-        self.inventory_df.loc[book_index[0], 'Quantity'] -= quantity
+        self.inventory_df.at[book_key, 'Quantity'] -= quantity
         
 
-        new_sale = pd.DataFrame({
-            'Date': [datetime.now().strftime('%Y-%m-%d')],
-            'Title': [title],
-            'Quantity Sold': [quantity],
-            'Total Revenue': [total_revenue]
-        })
-        
-        self.sales_df = pd.concat([self.sales_df, new_sale], ignore_index=True)
-        self.sales_df['Date'] = pd.to_datetime(self.sales_df['Date'])
+        sale_date = pd.Timestamp.now().normalize()
+        book_title = self.inventory_df.at[book_key, 'Title']
+
+        _add_categories(self.sales_df, {'Title': book_title})
+        self.sales_df = _append_row(
+            self.sales_df,
+            len(self.sales_df),
+            [sale_date, book_title, quantity, total_revenue]
+        )
         
 
         self.save_inventory()
-        self.save_sales()
+        self.save_sales(mode='append')
+        self._invalidate_analytics()
         
         print(f"Sale recorded: {quantity} copies of '{title}' for ${total_revenue:.2f}")
         return True
     
+    def batch_record_sales(self, sales):
+
+        titles = []
+        quantities = []
+        for title, quantity in sales:
+            try:
+                quantity = int(quantity)
+                if quantity <= 0:
+                    print(f"Sale quantity for '{title}' must be positive")
+                    return False
+            except (ValueError, TypeError):
+                print(f"Quantity for '{title}' must be a valid integer")
+                return False
+
+            titles.append(title)
+            quantities.append(quantity)
+
+        if not titles:
+            print("No sales to record")
+            return False
+
+        # Match the whole batch against the sorted lowercase-title index in one
+        # searchsorted call instead of one lookup per sale
+        book_keys = np.array([title.lower() for title in titles], dtype=object)
+        inventory_keys = self.inventory_df.index.to_numpy(dtype=object)
+        found = np.zeros(len(book_keys), dtype=bool)
+        if len(inventory_keys):
+            sorter = np.argsort(inventory_keys)
+            positions = np.searchsorted(inventory_keys, book_keys, sorter=sorter)
+            rows = sorter[np.minimum(positions, len(inventory_keys) - 1)]
+            found = inventory_keys[rows] == book_keys
+        if not found.all():
+            print(f"Book '{titles[np.argmin(found)]}' not found in inventory")
+            return False
+
+        # Check stock against the combined quantity per book before changing anything
+        requested = pd.Series(quantities, index=book_keys).groupby(level=0).sum()
+        available = self.inventory_df.loc[requested.index, 'Quantity']
+        short = requested[requested > available]
+        if not short.empty:
+            for book_key, quantity in short.items():
+                print(f"Insufficient stock for '{self.inventory_df.at[book_key, 'Title']}'. "
+                      f"Available: {available[book_key]}, Requested: {quantity}")
+            return False
+
+        self.inventory_df.loc[requested.index, 'Quantity'] -= requested.astype(self.inventory_df['Quantity'].dtype)
+
+        sold_books = self.inventory_df.iloc[rows]
+        quantities = np.array(quantities)
+        for title in sold_books['Title'].unique():
+            _add_categories(self.sales_df, {'Title': title})
+
+        new_sales = pd.DataFrame({
+            'Date': pd.Timestamp.now().normalize(),
+            'Title': sold_books['Title'].to_numpy(),
+            'Quantity Sold': quantities,
+            'Total Revenue': sold_books['Price'].to_numpy() * quantities
+        }, index=pd.RangeIndex(len(self.sales_df), len(self.sales_df) + len(quantities)))
+        self.sales_df = pd.concat([self.sales_df, new_sales.astype(self.sales_df.dtypes.to_dict())])
+
+        self.save_inventory()
+        self.save_sales(mode='append')
+        self._invalidate_analytics()
+
+        print(f"Recorded {len(quantities)} sales: {quantities.sum()} copies for "
+              f"${new_sales['Total Revenue'].sum():.2f}")
+        return True
+
     def remove_book(self, title):
 
-        book_index = self.inventory_df[self.inventory_df['Title'].str.lower() == title.lower()].index
+        book_key = self._find_book(title)
         
-        if book_index.empty:
+        if book_key is None:
             print(f"Book '{title}' not found in inventory")
             return False
         
-        self.inventory_df = self.inventory_df.drop(book_index[0]).reset_index(drop=True)
+        self.inventory_df.drop(index=book_key, inplace=True)
         self.save_inventory()
+        self._invalidate_analytics()
         print(f"Book '{title}' removed from inventory")
         return True
     
-    def save_inventory(self):
+    def display_inventory(self):
 
-        self.inventory_df.to_csv(self.inventory_file, index=False)
-    
-    def save_sales(self):
+        print("\n CURRENT INVENTORY")
+        print("-"*80)
+        if not self.inventory_df.empty:
+            print(self.inventory_df.to_string(index=False))
+        else:
+            print("No books in inventory")
+
+    def save_inventory(self, mode='full'):
 
-        self.sales_df.to_csv(self.sales_file, index=False)
+        if mode == 'append' and not _is_feather(self.inventory_file):
+            pending = self.inventory_df.iloc[self._saved_inventory_rows:]
+            # Zip the column arrays rather than boxing every row through itertuples
+            rows = zip(*(pending[col].to_numpy() for col in INVENTORY_COLUMNS))
+            _append_rows_csv(self.inventory_file, rows, INVENTORY_COLUMNS)
+        else:
+            _write_table(self.inventory_df, self.inventory_file)
+        self._saved_inventory_rows = len(self.inventory_df)
+    
+    def save_sales(self, mode='full'):
+
+        if mode == 'append' and not _is_feather(self.sales_file):
+            pending = self.sales_df.iloc[self._saved_sales_rows:]
+            rows = zip(
+                pending['Date'].dt.strftime('%Y-%m-%d'),
+                pending['Title'],
+                pending['Quantity Sold'].to_numpy(),
+                pending['Total Revenue'].to_numpy()
+            )
+            _append_rows_csv(self.sales_file, rows, SALES_COLUMNS)
+        else:
+            _write_table(self.sales_df, self.sales_file)
+        self._saved_sales_rows = len(self.sales_df)
     
     def generate_report(self):
 
@@ -225,50 +519,136 @@ class Bookstore:
             
 
             print("\nTop 5 Best Selling Books:")
-            best_sellers = self.sales_df.groupby('Title')['Quantity Sold'].sum().nlargest(5)
+            best_sellers = self.sales_df.groupby('Title', observed=True)['Quantity Sold'].sum().nlargest(5)
             for title, quantity in best_sellers.items():
                 print(f"  • {title}: {quantity} copies sold")
         else:
             print("No sales recorded")
     
-    def analyze_sales_with_numpy(self):
+    def _sales_stats_from_arrays(self, revenues, quantities):
 
-        if self.sales_df.empty:
+        sorted_revenues = np.sort(revenues)
+        count, revenue_mean, revenue_m2 = _update_moments((0, 0.0, 0.0), sorted_revenues)
+        mid = count // 2
+        if count % 2:
+            revenue_median = sorted_revenues[mid]
+        else:
+            revenue_median = (sorted_revenues[mid - 1] + sorted_revenues[mid]) / 2
+        quantity_sum = quantities.sum()
+
+        return {
+            'revenue_stats': {
+                'Total Revenue': revenue_mean * count,
+                'Average Revenue per Sale': revenue_mean,
+                'Median Revenue per Sale': revenue_median,
+                'Revenue Standard Deviation': np.sqrt(revenue_m2 / count),
+                'Maximum Sale': sorted_revenues[-1],
+                'Minimum Sale': sorted_revenues[0]
+            },
+            'total_quantity': quantity_sum,
+            'average_quantity': quantity_sum / count,
+            'max_quantity': quantities.max(),
+            'count': count,
+            'first_revenues': revenues[:min(5, len(revenues))],
+            'last_revenues': revenues[-min(5, len(revenues)):]
+        }
+
+    def _sales_stats_from_chunks(self, chunksize):
+
+        moments = (0, 0.0, 0.0)
+        revenue_min = np.inf
+        revenue_max = -np.inf
+        quantity_sum = 0
+        quantity_max = 0
+        first_revenues = np.empty(0)
+        last_revenues = np.empty(0)
+
+        chunks = pd.read_csv(
+            self.sales_file,
+            usecols=['Quantity Sold', 'Total Revenue'],
+            dtype=SALES_DTYPES,
+            chunksize=chunksize
+        )
+        for chunk in chunks:
+            revenues = chunk['Total Revenue'].to_numpy()
+            quantities = chunk['Quantity Sold'].to_numpy()
+            if len(revenues) == 0:
+                continue
+
+            moments = _update_moments(moments, revenues)
+            revenue_min = min(revenue_min, revenues.min())
+            revenue_max = max(revenue_max, revenues.max())
+            quantity_sum += quantities.sum()
+            quantity_max = max(quantity_max, quantities.max())
+
+            if len(first_revenues) < 5:
+                first_revenues = np.concatenate([first_revenues, revenues[:5 - len(first_revenues)]])
+            last_revenues = np.concatenate([last_revenues, revenues])[-5:]
+
+        count, revenue_mean, revenue_m2 = moments
+        if count == 0:
+            return None
+        revenue_std = np.sqrt(revenue_m2 / count)
+
+        # The median needs every value at once, so it is left out when streaming
+        return {
+            'revenue_stats': {
+                'Total Revenue': revenue_mean * count,
+                'Average Revenue per Sale': revenue_mean,
+                'Revenue Standard Deviation': revenue_std,
+                'Maximum Sale': revenue_max,
+                'Minimum Sale': revenue_min
+            },
+            'total_quantity': quantity_sum,
+            'average_quantity': quantity_sum / count,
+            'max_quantity': quantity_max,
+            'count': count,
+            'first_revenues': first_revenues,
+            'last_revenues': last_revenues
+        }
+
+    def analyze_sales_with_numpy(self, chunksize=None):
+
+        # Stream from disk only while the log is not in memory yet; once it is
+        # loaded the in-memory arrays are cheaper and also give the median
+        stream = (
+            chunksize
+            and self._sales_df is None
+            and not _is_feather(self.sales_file)
+            and os.path.exists(self.sales_file)
+        )
+        if stream:
+            stats = self._sales_stats_from_chunks(chunksize)
+        elif not self.sales_df.empty:
+            stats = self._sales_stats_from_arrays(
+                self.sales_df['Total Revenue'].values,
+                self.sales_df['Quantity Sold'].values
+            )
+        else:
+            stats = None
+
+        if stats is None:
             print("No sales data available for analysis")
             return
         
         print("\nNUMPY ANALYSIS")
         print("-" * 30)
         
-
-        revenues = self.sales_df['Total Revenue'].values
-        quantities = self.sales_df['Quantity Sold'].values
-        
-
-        revenue_stats = {
-            'Total Revenue': np.sum(revenues),
-            'Average Revenue per Sale': np.mean(revenues),
-            'Median Revenue per Sale': np.median(revenues),
-            'Revenue Standard Deviation': np.std(revenues),
-            'Maximum Sale': np.max(revenues),
-            'Minimum Sale': np.min(revenues)
-        }
-        
         print("Revenue Analysis:")
-        for key, value in revenue_stats.items():
+        for key, value in stats['revenue_stats'].items():
             print(f"  {key}: ${value:.2f}")
         
 
         print("\nQuantity Analysis:")
-        print(f"  Total Books Sold: {np.sum(quantities)}")
-        print(f"  Average Books per Sale: {np.mean(quantities):.2f}")
-        print(f"  Most Books in Single Sale: {np.max(quantities)}")
+        print(f"  Total Books Sold: {stats['total_quantity']}")
+        print(f"  Average Books per Sale: {stats['average_quantity']:.2f}")
+        print(f"  Most Books in Single Sale: {stats['max_quantity']}")
         
 
-        if len(revenues) > 1:
+        if stats['count'] > 1:
 
-            recent_sales = revenues[-min(5, len(revenues)):]
-            older_sales = revenues[:min(5, len(revenues))]
+            recent_sales = stats['last_revenues']
+            older_sales = stats['first_revenues']
             
             if len(older_sales) > 0 and len(recent_sales) > 0:
                 growth_rate = (np.mean(recent_sales) - np.mean(older_sales)) / np.mean(older_sales) * 100
@@ -283,15 +663,11 @@ class Bookstore:
         print("\nPANDAS ANALYSIS")
         print("-" * 30)
 
-        sales_with_inventory = self.sales_df.merge(
-            self.inventory_df[['Title', 'Author', 'Genre']], 
-            on='Title', 
-            how='left'
-        )
+        sales_with_inventory = self._sales_enriched
 
         if 'Genre' in sales_with_inventory.columns:
             print("Sales by Genre:")
-            genre_sales = sales_with_inventory.groupby('Genre').agg({
+            genre_sales = sales_with_inventory.groupby('Genre', observed=True).agg({
                 'Quantity Sold': 'sum',
                 'Total Revenue': 'sum'
             }).round(2)
@@ -299,7 +675,7 @@ class Bookstore:
         
 
         print("\nSales by Author:")
-        author_sales = sales_with_inventory.groupby('Author').agg({
+        author_sales = sales_with_inventory.groupby('Author', observed=True).agg({
             'Quantity Sold': 'sum',
             'Total Revenue': 'sum'
         }).round(2)
@@ -308,10 +684,7 @@ class Bookstore:
 
         if len(self.sales_df) > 0:
             print("\nMonthly Sales Trends:")
-            monthly_sales = self.sales_df.groupby(self.sales_df['Date'].dt.strftime('%Y-%m')).agg({
-                'Quantity Sold': 'sum',
-                'Total Revenue': 'sum'
-            }).round(2)
+            monthly_sales = self._monthly_sales.round(2)
             print(monthly_sales)
     
     def create_visualizations(self):
@@ -319,21 +692,26 @@ class Bookstore:
                 print("No sales data available for visualization")
                 return
             
+            # Plotting libraries are slow to import, so load them only when charting.
+            # The dashboard is only written to a PNG, so render off-screen with Agg.
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+
             plt.style.use('seaborn-v0_8-darkgrid')
             sns.set_palette("husl")
             
             fig = plt.figure(figsize=(12, 10))
 
-            sales_with_inventory = self.sales_df.merge(
-                self.inventory_df[['Title', 'Author', 'Genre']], 
-                on='Title', 
-                how='left'
-            )
+            sales_with_inventory = self._sales_enriched
+            if 'Genre' in sales_with_inventory.columns:
+                genre_revenue = sales_with_inventory.groupby('Genre', observed=True)['Total Revenue'].sum()
 
             # Bar Chart
             plt.subplot(2, 2, 1)
             if 'Genre' in sales_with_inventory.columns:
-                genre_sales = sales_with_inventory.groupby('Genre')['Total Revenue'].sum().sort_values(ascending=False)
+                genre_sales = genre_revenue.sort_values(ascending=False)
                 genre_sales.plot(kind='bar', color='skyblue')
                 plt.title('Total Revenue by Genre', fontsize=14, fontweight='bold')
                 plt.xlabel('Genre')
@@ -342,7 +720,7 @@ class Bookstore:
 
             #Line Chart
             plt.subplot(2, 2, 2)
-            monthly_revenue = self.sales_df.groupby(self.sales_df['Date'].dt.strftime('%Y-%m'))['Total Revenue'].sum()
+            monthly_revenue = self._monthly_sales['Total Revenue']
             monthly_revenue.plot(kind='line', marker='o', color='green', linewidth=2, markersize=6)
             plt.title('Monthly Sales Trends', fontsize=14, fontweight='bold')
             plt.xlabel('Month')
@@ -352,97 +730,92 @@ class Bookstore:
             # Pie Chart
             plt.subplot(2, 2, 3)
             if 'Genre' in sales_with_inventory.columns:
-                genre_revenue = sales_with_inventory.groupby('Genre')['Total Revenue'].sum()
                 plt.pie(genre_revenue.values, labels=genre_revenue.index, autopct='%1.1f%%', startangle=90)
                 plt.title('Revenue Share by Genre', fontsize=14, fontweight='bold')
 
             #Heatmap
             plt.subplot(2, 2, 4)
             if len(sales_with_inventory) > 1:
-                price_sales_data = sales_with_inventory.merge(
-                    self.inventory_df[['Title', 'Price']], 
-                    on='Title', 
-                    how='left'
-                )
-                
-                if not price_sales_data.empty and 'Price' in price_sales_data.columns:
-                    corr_data = price_sales_data[['Price', 'Quantity Sold', 'Total Revenue']].corr()
-                    sns.heatmap(corr_data, annot=True, cmap='coolwarm', center=0, 
-                            square=True, fmt='.2f')
-                    plt.title('Price vs Sales Correlation', fontsize=14, fontweight='bold')
+                corr_data = sales_with_inventory[['Price', 'Quantity Sold', 'Total Revenue']].corr()
+                sns.heatmap(corr_data, annot=True, cmap='coolwarm', center=0, 
+                        square=True, fmt='.2f')
+                plt.title('Price vs Sales Correlation', fontsize=14, fontweight='bold')
             
             plt.tight_layout()
-            plt.savefig('bookstore_analytics_dashboard.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            plt.savefig('bookstore_analytics_dashboard.png', dpi=120, bbox_inches='tight')
+            plt.close(fig)
             
             print("Visualization saved as 'bookstore_analytics_dashboard.png'")
 
+SAMPLE_BOOKS = [
+    ("The Great Gatsby", "F. Scott Fitzgerald", "Fiction", 12.99, 25),
+    ("To Kill a Mockingbird", "Harper Lee", "Fiction", 14.50, 30),
+    ("1984", "George Orwell", "Dystopian", 13.99, 20),
+    ("Pride and Prejudice", "Jane Austen", "Romance", 11.99, 15),
+    ("The Catcher in the Rye", "J.D. Salinger", "Fiction", 12.50, 18),
+    ("Lord of the Flies", "William Golding", "Adventure", 10.99, 22),
+    ("Animal Farm", "George Orwell", "Political Satire", 9.99, 28),
+    ("Brave New World", "Aldous Huxley", "Science Fiction", 13.50, 16),
+    ("The Hobbit", "J.R.R. Tolkien", "Fantasy", 15.99, 12),
+    ("Fahrenheit 451", "Ray Bradbury", "Science Fiction", 12.75, 20),
+    ("Jane Eyre", "Charlotte Brontë", "Romance", 11.50, 14),
+    ("Wuthering Heights", "Emily Brontë", "Gothic", 10.75, 17),
+    ("The Picture of Dorian Gray", "Oscar Wilde", "Gothic", 12.25, 19),
+    ("Dracula", "Bram Stoker", "Horror", 11.99, 21),
+    ("Frankenstein", "Mary Shelley", "Horror", 10.50, 23)
+]
+
 def generate_sample_inventory():
 
-    sample_books = [
-        ("The Great Gatsby", "F. Scott Fitzgerald", "Fiction", 12.99, 25),
-        ("To Kill a Mockingbird", "Harper Lee", "Fiction", 14.50, 30),
-        ("1984", "George Orwell", "Dystopian", 13.99, 20),
-        ("Pride and Prejudice", "Jane Austen", "Romance", 11.99, 15),
-        ("The Catcher in the Rye", "J.D. Salinger", "Fiction", 12.50, 18),
-        ("Lord of the Flies", "William Golding", "Adventure", 10.99, 22),
-        ("Animal Farm", "George Orwell", "Political Satire", 9.99, 28),
-        ("Brave New World", "Aldous Huxley", "Science Fiction", 13.50, 16),
-        ("The Hobbit", "J.R.R. Tolkien", "Fantasy", 15.99, 12),
-        ("Fahrenheit 451", "Ray Bradbury", "Science Fiction", 12.75, 20),
-        ("Jane Eyre", "Charlotte Brontë", "Romance", 11.50, 14),
-        ("Wuthering Heights", "Emily Brontë", "Gothic", 10.75, 17),
-        ("The Picture of Dorian Gray", "Oscar Wilde", "Gothic", 12.25, 19),
-        ("Dracula", "Bram Stoker", "Horror", 11.99, 21),
-        ("Frankenstein", "Mary Shelley", "Horror", 10.50, 23)
-    ]
-    
-    df = pd.DataFrame(sample_books, columns=['Title', 'Author', 'Genre', 'Price', 'Quantity'])
-    df.to_csv('inventory.csv', index=False)
+    _write_rows_csv('inventory.csv', SAMPLE_BOOKS, INVENTORY_COLUMNS)
     print("Sample inventory.csv created!")
 
 def generate_sample_sales():
 
-    np.random.seed(42) 
-    books = [
+    rng = np.random.default_rng(42)
+    books = np.array([
         "The Great Gatsby", "To Kill a Mockingbird", "1984", "Pride and Prejudice",
         "The Catcher in the Rye", "Lord of the Flies", "Animal Farm", "Brave New World",
         "The Hobbit", "Fahrenheit 451"
-    ]
-    
-    sales_data = []
-    current_date = datetime.now() - timedelta(days=90) 
-    for _ in range(150):
-        date = current_date + timedelta(days=np.random.randint(0, 90))
-        title = np.random.choice(books)
-        quantity = np.random.randint(1, 6) 
-        prices = {
-            "The Great Gatsby": 12.99,
-            "To Kill a Mockingbird": 14.50,
-            "1984": 13.99,
-            "Pride and Prejudice": 11.99,
-            "The Catcher in the Rye": 12.50,
-            "Lord of the Flies": 10.99,
-            "Animal Farm": 9.99,
-            "Brave New World": 13.50,
-            "The Hobbit": 15.99,
-            "Fahrenheit 451": 12.75
-        }
-        
-        price = prices.get(title, 12.00)
-        total_revenue = price * quantity
-        
-        sales_data.append([
-            date.strftime('%Y-%m-%d'),
-            title,
-            quantity,
-            round(total_revenue, 2)
-        ])
-    
-    df = pd.DataFrame(sales_data, columns=['Date', 'Title', 'Quantity Sold', 'Total Revenue'])
-    df.to_csv('sales.csv', index=False)
+    ])
+    prices = pd.Series({title: price for title, _, _, price, _ in SAMPLE_BOOKS})
+
+    n_sales = 150
+    days = rng.integers(0, 90, size=n_sales)
+    title_idx = rng.integers(0, len(books), size=n_sales)
+    quantities = rng.integers(1, 6, size=n_sales)
+
+    start_date = np.datetime64(datetime.now().date()) - np.timedelta64(90, 'D')
+    dates = start_date + days.astype('timedelta64[D]')
+    titles = books[title_idx]
+    revenues = np.round(prices.reindex(titles).fillna(12.00).to_numpy() * quantities, 2)
+
+    rows = zip(
+        np.datetime_as_string(dates, unit='D').tolist(),
+        titles.tolist(),
+        quantities.tolist(),
+        revenues.tolist()
+    )
+    _write_rows_csv('sales.csv', rows, SALES_COLUMNS)
     print("Sample sales.csv created!")
 
+MENU_TEXT = "\n".join([
+    "\n" + "="*50,
+    "BOOKSTORE INVENTORY AND ANALYTICS SYSTEM",
+    "="*50,
+    "1. Add New Book",
+    "2. Update Book Quantity",
+    "3. Record Sale",
+    "4. Remove Book",
+    "5. View Inventory",
+    "6. Generate Report",
+    "7. NumPy Analysis",
+    "8. Pandas Analysis",
+    "9. Create Visualizations",
+    "10. Exit",
+    "-"*50
+])
+
 def main_menu():
     if not os.path.exists('inventory.csv'):
         generate_sample_inventory()
@@ -452,20 +825,7 @@ def main_menu():
     bookstore = Bookstore()
     
     while True:
-        print("\n" + "="*50)
-        print("BOOKSTORE INVENTORY AND ANALYTICS SYSTEM")
-        print("="*50)
-        print("1. Add New Book")
-        print("2. Update Book Quantity")
-        print("3. Record Sale")
-        print("4. Remove Book")
-        print("5. View Inventory")
-        print("6. Generate Report")
-        print("7. NumPy Analysis")
-        print("8. Pandas Analysis")
-        print("9. Create Visualizations")
-        print("10. Exit")
-        print("-"*50)
+        print(MENU_TEXT)
         
         choice = input("Enter your choice (1-10): ").strip()
         
@@ -504,12 +864,7 @@ def main_menu():
         
         elif choice == '5':
         
-            print("\n CURRENT INVENTORY")
-            print("-"*80)
-            if not bookstore.inventory_df.empty:
-                print(bookstore.inventory_df.to_string(index=False))
-            else:
-                print("No books in inventory")
+            bookstore.display_inventory()
         
         elif choice == '6':
           